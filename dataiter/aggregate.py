@@ -71,8 +71,8 @@ def all(x):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.all)
+            f = (all_apply, generic_numba(np.all))
+            f = select(f, data, x)
             aggregate.default = True
             return f(data[x].as_boolean(),
                      data._group_,
@@ -85,6 +85,9 @@ def all(x):
     x = x.as_boolean()
     return np.all(x).item()
 
+def all_apply(x, group, drop_na, default, nrequired):
+    return reduce_apply(np.logical_and, x, group)
+
 @composite
 def any(x):
     """
@@ -102,8 +105,8 @@ def any(x):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.any)
+            f = (any_apply, generic_numba(np.any))
+            f = select(f, data, x)
             aggregate.default = False
             return f(data[x].as_boolean(),
                      data._group_,
@@ -116,6 +119,9 @@ def any(x):
     x = x.as_boolean()
     return np.any(x).item()
 
+def any_apply(x, group, drop_na, default, nrequired):
+    return reduce_apply(np.logical_or, x, group)
+
 # @composite skipped on purpose due to allowing calls with no x given.
 def count(x="", *, drop_na=False):
     """
@@ -132,8 +138,8 @@ def count(x="", *, drop_na=False):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x or "_group_")(len)
+            f = (count_apply, generic_numba(len))
+            f = select(f, data, x or "_group_")
             aggregate.default = 0
             return f(data[x or "_group_"],
                      data._group_,
@@ -148,6 +154,11 @@ def count(x="", *, drop_na=False):
     x = handle_na(x, drop_na)
     return len(x)
 
+def count_apply(x, group, drop_na, default, nrequired):
+    if drop_na:
+        return reduce_apply(np.add, ~x.is_na(), group, dtype=int)
+    return np.diff(group_bounds(group))
+
 @composite
 def count_unique(x, *, drop_na=False):
     """
@@ -175,8 +186,23 @@ def count_unique(x, *, drop_na=False):
     x = handle_na(x, drop_na)
     return len(set(x))
 
-@deco.listify
 def count_unique_apply(x, group, drop_na):
+    if not (x.is_boolean() or x.is_datetime() or x.is_float() or x.is_integer()):
+        return count_unique_apply_generic(x, group, drop_na)
+    # Sort values within groups and count the changes. Missing values
+    # are not equal to each other and are thus counted as unique.
+    order = np.lexsort((x, group))
+    xs = np.asarray(x)[order]
+    starts = group_bounds(group)[:-1]
+    unique = np.ones(len(xs), bool)
+    unique[1:] = xs[1:] != xs[:-1]
+    unique[starts] = True
+    if drop_na:
+        unique &= ~x.is_na()[order]
+    return reduce_apply(np.add, unique, group, dtype=int)
+
+@deco.listify
+def count_unique_apply_generic(x, group, drop_na):
     for xg in yield_groups(x, group, drop_na):
         yield len(set(xg))
 
@@ -217,6 +243,13 @@ def generic_numba(function):
         return out
     return aggregate
 
+def group_bounds(group):
+    # Groups must be contiguous for this to work!
+    if len(group) == 0:
+        return np.array([], int)
+    bounds = np.flatnonzero(group[1:] != group[:-1]) + 1
+    return np.concatenate(([0], bounds, [len(group)]))
+
 def handle_na(x, drop_na):
     return x[~x.is_na()] if drop_na else x
 
@@ -269,8 +302,8 @@ def max(x, *, drop_na=True):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.amax)
+            f = (max_apply, generic_numba(np.amax))
+            f = select(f, data, x)
             aggregate.default = data[x].na_value
             return f(data[x],
                      data._group_,
@@ -282,9 +315,20 @@ def max(x, *, drop_na=True):
 
         aggregate.group_aware = True
         return aggregate
+    if drop_na and (x.is_datetime() or x.is_float()) and len(x) >= 1:
+        # fmax skips NaN and NaT without a filtered copy
+        # and only gives a missing value if all are missing.
+        value = np.fmax.reduce(x)
+        return value.item() if value == value else x.na_value
     x = handle_na(x, drop_na)
     return np.amax(x).item() if len(x) >= 1 else x.na_value
 
+def max_apply(x, group, drop_na, default, nrequired):
+    if not (x.is_boolean() or x.is_datetime() or x.is_float() or x.is_integer()):
+        return generic(np.amax)(x, group, drop_na, default, nrequired)
+    # fmax ignores NaN and NaT, all-missing groups come out missing.
+    return reduce_apply(np.fmax if drop_na else np.maximum, x, group)
+
 @composite
 def mean(x, *, drop_na=True):
     """
@@ -301,8 +345,8 @@ def mean(x, *, drop_na=True):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.mean)
+            f = (mean_apply, generic_numba(np.mean))
+            f = select(f, data, x)
             aggregate.default = np.nan
             return f(data[x],
                      data._group_,
@@ -317,6 +361,15 @@ def mean(x, *, drop_na=True):
     x = handle_na(x, drop_na)
     return np.mean(x).item() if len(x) >= 1 else np.nan
 
+def mean_apply(x, group, drop_na, default, nrequired):
+    if not (x.is_boolean() or x.is_float() or x.is_integer()):
+        return generic(np.mean)(x, group, drop_na, default, nrequired)
+    total, n = sum_count_apply(x, group, drop_na)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.divide(total, n, dtype=total.dtype)
+    # Give the same dtype as np.mean, e.g. float32 for float32.
+    return out.astype(x.dtype, copy=False) if x.is_float() else out
+
 @composite
 def median(x, *, drop_na=True):
     """
@@ -362,8 +415,8 @@ def min(x, *, drop_na=True):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.amin)
+            f = (min_apply, generic_numba(np.amin))
+            f = select(f, data, x)
             aggregate.default = data[x].na_value
             return f(data[x],
                      data._group_,
@@ -375,9 +428,20 @@ def min(x, *, drop_na=True):
 
         aggregate.group_aware = True
         return aggregate
+    if drop_na and (x.is_datetime() or x.is_float()) and len(x) >= 1:
+        # fmin skips NaN and NaT without a filtered copy
+        # and only gives a missing value if all are missing.
+        value = np.fmin.reduce(x)
+        return value.item() if value == value else x.na_value
     x = handle_na(x, drop_na)
     return np.amin(x).item() if len(x) >= 1 else x.na_value
 
+def min_apply(x, group, drop_na, default, nrequired):
+    if not (x.is_boolean() or x.is_datetime() or x.is_float() or x.is_integer()):
+        return generic(np.amin)(x, group, drop_na, default, nrequired)
+    # fmin ignores NaN and NaT, all-missing groups come out missing.
+    return reduce_apply(np.fmin if drop_na else np.minimum, x, group)
+
 @composite
 def mode(x, *, drop_na=True):
     """
@@ -415,11 +479,16 @@ def mode_apply_numba(x, group, drop_na):
     out = []
     for xg in yield_groups_numba(x, group, drop_na):
         if len(xg) > 0:
-            ng = np.full(len(xg), 0)
-            for i in range(len(xg)):
-                for j in range(len(xg)):
-                    if xg[j] == xg[i]:
-                        ng[i] += 1
+            # Count occurrences of each element via a sorted copy instead
+            # of comparing all pairs. Missing values are not equal to
+            # anything and thus have no occurrences. Leave them out of
+            # the sorted copy, since np.sort puts NaT first, not last.
+            # Of tied elements, np.argmax picks the first in original order.
+            na = is_na_numba(xg)
+            xs = np.sort(xg[~na])
+            ng = (np.searchsorted(xs, xg, side="right") -
+                  np.searchsorted(xs, xg, side="left"))
+            ng[na] = 0
             out.append(xg[np.argmax(ng)])
         else:
             out.append(None)
@@ -464,13 +533,26 @@ def nth(x, index, *, drop_na=False):
     except IndexError:
         return x.na_value
 
-@deco.listify
 def nth_apply(x, group, index, drop_na):
-    for xg in yield_groups(x, group, drop_na):
-        try:
-            yield xg[index]
-        except IndexError:
-            yield None
+    bounds = group_bounds(group)
+    if drop_na:
+        keep = ~x.is_na()
+        x = x[keep]
+        # Map group bounds to positions among the kept elements.
+        bounds = np.concatenate(([0], np.cumsum(keep)))[bounds]
+    starts = bounds[:-1]
+    ends = bounds[1:]
+    # Pick the element of each group with a single indexing operation,
+    # groups too short for index get None to be replaced by the default.
+    pos = starts + index if index >= 0 else ends + index
+    found = (pos >= starts) & (pos < ends)
+    out = x[np.where(found, pos, 0)] if len(x) > 0 else x[:0]
+    if found.all():
+        return out
+    out = list(out) if len(x) > 0 else [None] * len(found)
+    for i in np.flatnonzero(~found):
+        out[i] = None
+    return out
 
 @njit(cache=dataiter.USE_NUMBA_CACHE)
 def nth_apply_numba(x, group, index, drop_na):
@@ -525,6 +607,14 @@ def quantile_apply_numba(x, group, q, drop_na):
         out.append(np.quantile(xg, q) if len(xg) >= 1 else np.nan)
     return out
 
+def reduce_apply(ufunc, x, group, **kwargs):
+    # Reduce all groups with a single ufunc call
+    # instead of calling a function on each group.
+    starts = group_bounds(group)[:-1]
+    if len(starts) == 0:
+        return []
+    return ufunc.reduceat(np.asarray(x), starts, **kwargs)
+
 def select(functions, data, name):
     return functions[use_numba(data[name])]
 
@@ -547,10 +637,10 @@ def std(x, *, ddof=0, drop_na=True):
             if ddof == 0:
                 # Numba doesn't support the ddof argument,
                 # so can only handle the default ddof=0.
-                f = (generic, generic_numba)
-                f = select(f, data, x)(np.std)
+                f = (std_apply, generic_numba(np.std))
+                f = select(f, data, x)
             else:
-                f = generic(np.std, ddof=ddof)
+                f = functools.partial(std_apply, ddof=ddof)
             aggregate.default = np.nan
             return f(data[x],
                      data._group_,
@@ -578,8 +668,8 @@ def sum(x, *, drop_na=True):
     """
     if isinstance(x, str):
         def aggregate(data):
-            f = (generic, generic_numba)
-            f = select(f, data, x)(np.sum)
+            f = (sum_apply, generic_numba(np.sum))
+            f = select(f, data, x)
             aggregate.default = 0
             return f(data[x],
                      data._group_,
@@ -594,6 +684,32 @@ def sum(x, *, drop_na=True):
     x = handle_na(x, drop_na)
     return np.sum(x).item()
 
+def std_apply(x, group, drop_na, default, nrequired, *, ddof=0):
+    if not (x.is_boolean() or x.is_float() or x.is_integer()):
+        return generic(np.std, ddof=ddof)(x, group, drop_na, default, nrequired)
+    return np.sqrt(var_apply(x, group, drop_na, default, nrequired, ddof=ddof))
+
+def sum_apply(x, group, drop_na, default, nrequired):
+    if not (x.is_boolean() or x.is_float() or x.is_integer()):
+        return generic(np.sum)(x, group, drop_na, default, nrequired)
+    if drop_na:
+        x = np.where(x.is_na(), 0, x)
+    # Use the same accumulator dtype as np.sum would,
+    # e.g. summing booleans should give integers.
+    return reduce_apply(np.add, x, group, dtype=np.sum(x[:0]).dtype)
+
+def sum_count_apply(x, group, drop_na):
+    # Return group-wise sums and counts for mean and variance.
+    # Always sum in float64 to not lose precision for float32 in
+    # large groups, callers cast results back to the input dtype.
+    dtype = np.float64
+    if drop_na:
+        na = x.is_na()
+        total = reduce_apply(np.add, np.where(na, 0, x), group, dtype=dtype)
+        return np.asarray(total), np.asarray(reduce_apply(np.add, ~na, group, dtype=int))
+    total = reduce_apply(np.add, x, group, dtype=dtype)
+    return np.asarray(total), np.diff(group_bounds(group))
+
 def use_numba(x):
     # Numba can't handle all dtypes, use conditionally.
     # Strings are supported, but performance is bad.
@@ -623,10 +739,10 @@ def var(x, *, ddof=0, drop_na=True):
             if ddof == 0:
                 # Numba doesn't support the ddof argument,
                 # so can only handle the default ddof=0.
-                f = (generic, generic_numba)
-                f = select(f, data, x)(np.var)
+                f = (var_apply, generic_numba(np.var))
+                f = select(f, data, x)
             else:
-                f = generic(np.var, ddof=ddof)
+                f = functools.partial(var_apply, ddof=ddof)
             aggregate.default = np.nan
             return f(data[x],
                      data._group_,
@@ -641,17 +757,34 @@ def var(x, *, ddof=0, drop_na=True):
     x = handle_na(x, drop_na)
     return np.var(x, ddof=ddof).item() if len(x) >= 2 else np.nan
 
+def var_apply(x, group, drop_na, default, nrequired, *, ddof=0):
+    if not (x.is_boolean() or x.is_float() or x.is_integer()):
+        return generic(np.var, ddof=ddof)(x, group, drop_na, default, nrequired)
+    # Two passes as in np.var: first group means,
+    # then sums of squared deviations from those.
+    total, n = sum_count_apply(x, group, drop_na)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = np.divide(total, n, dtype=total.dtype)
+        sizes = np.diff(group_bounds(group))
+        dev = np.asarray(x, total.dtype) - np.repeat(mu, sizes)
+        if drop_na:
+            dev[x.is_na()] = 0
+        ss = np.asarray(reduce_apply(np.add, dev * dev, group))
+        out = np.divide(ss, n - ddof, dtype=ss.dtype)
+    out[n < nrequired] = default
+    # Give the same dtype as np.var, e.g. float32 for float32.
+    return out.astype(x.dtype, copy=False) if x.is_float() else out
+
 def yield_groups(x, group, drop_na):
     # Groups must be contiguous for this to work!
-    i = 0
-    n = len(x)
-    for j in range(1, n + 1):
-        if j < n and group[j] == group[i]: continue
+    if drop_na:
+        na = x.is_na()
+    bounds = group_bounds(group).tolist()
+    for i, j in zip(bounds, bounds[1:]):
         xij = x[i:j]
         if drop_na:
-            xij = xij[~xij.is_na()]
+            xij = xij[~na[i:j]]
         yield xij
-        i = j
 
 @njit(cache=dataiter.USE_NUMBA_CACHE)
 def yield_groups_numba(x, group, drop_na):
@@ -23,7 +23,6 @@
 import dataiter
 import functools
 import itertools
-import json
 import numpy as np
 import pickle
 
@@ -219,7 +218,8 @@ class DataFrame(dict):
         group_colnames = self._group_colnames
         data = self.sort(**dict.fromkeys(group_colnames, 1))
         data._index_ = np.arange(data.nrow)
-        stat = data.unique(*group_colnames).select("_index_", *group_colnames)
+        stat = data.select("_index_", *group_colnames)
+        stat = stat.slice(data._get_group_starts(*group_colnames))
         indices = np.split(data._index_, stat._index_[1:])
         group_aware = [getattr(x, "group_aware", False) for x in colname_function_pairs.values()]
         if any(group_aware):
@@ -496,7 +496,7 @@ class DataFrame(dict):
         """
         data = string
         if isinstance(data, str):
-            data = json.loads(data, **kwargs)
+            data = util.load_json(data, **kwargs)
         if not isinstance(data, list):
             raise TypeError("Not a list")
         keys = util.unique_keys(itertools.chain(*data))
@@ -562,6 +562,21 @@ class DataFrame(dict):
                 ba[item[0]] = ba.pop(item[1])
         return ab.rbind(ba).sort(_aid_=1, _bid_=1).unselect("_aid_", "_bid_")
 
+    def _get_group_starts(self, *colnames):
+        # Return indices of the first rows of each group,
+        # assuming rows are already sorted by colnames.
+        # Consider NaN and NaT equal to themselves like unique does.
+        change = np.zeros(self.nrow, bool)
+        change[:1] = True
+        for colname in colnames:
+            column = self[colname]
+            differ = np.asarray(column[1:] != column[:-1], bool)
+            if column.is_datetime() or column.is_float():
+                na = column.is_na()
+                differ &= ~(na[1:] & na[:-1])
+            change[1:] |= differ
+        return np.flatnonzero(change)
+
     def _get_join_indices(self, other, by1, by2):
         other_ids = list(zip(*[other[x] for x in by2]))
         other_by_id = {other_ids[i]: i for i in range(other.nrow)}
@@ -853,7 +868,7 @@ class DataFrame(dict):
         """
         Return a new data frame from CSV file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `columns` is an optional list of columns to limit to. `dtypes` is an
         optional dict mapping column names to NumPy datatypes.
         """
@@ -876,7 +891,7 @@ class DataFrame(dict):
         """
         Return a new data frame from JSON file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `columns` is an optional list of columns to limit to. `dtypes` is an
         optional dict mapping column names to NumPy datatypes. `kwargs` are
         passed to ``json.load``.
@@ -913,7 +928,7 @@ class DataFrame(dict):
         """
         Return a new data frame from Pickle file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         with util.xopen(path, "rb") as f:
             return cls(pickle.load(f))
@@ -1071,9 +1086,7 @@ class DataFrame(dict):
         data = self.select(*by)
         data._index_ = np.arange(data.nrow)
         data = data.sort(**dict.fromkeys(by, 1))
-        data._sorted_index_ = np.arange(data.nrow)
-        stat = data.unique(*by)
-        return np.split(data._index_, stat._sorted_index_[1:])
+        return np.split(data._index_, data._get_group_starts(*by)[1:])
 
     def _split_join_by(self, *by):
         by1 = [x if isinstance(x, str) else x[0] for x in by]
@@ -1253,7 +1266,7 @@ class DataFrame(dict):
         """
         Write data frame to CSV file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         data = self.to_pandas()
         util.makedirs_for_file(path)
@@ -1263,7 +1276,7 @@ class DataFrame(dict):
         """
         Write data frame to JSON file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `kwargs` are passed to ``json.JSONEncoder``.
         """
         return self.to_list_of_dicts().write_json(path, encoding=encoding, **kwargs)
@@ -1291,7 +1304,7 @@ class DataFrame(dict):
         """
         Write data frame to Pickle file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         util.makedirs_for_file(path)
         with util.xopen(path, "wb") as f:
@@ -85,7 +85,7 @@ class GeoJSON(DataFrame):
         """
         Return data from GeoJSON file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `columns` is an optional list of columns to limit to. `dtypes` is an
         optional dict mapping column names to NumPy datatypes. `kwargs` are
         passed to ``json.load``.
@@ -130,7 +130,7 @@ class GeoJSON(DataFrame):
         """
         Write data to GeoJSON file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `kwargs` are passed to ``json.dumps``.
         """
         kwargs.setdefault("default", str)
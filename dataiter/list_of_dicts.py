@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 
 import copy
+import copyreg
 import csv
 import dataiter
 import itertools
@@ -150,12 +151,16 @@ class ListOfDicts(list):
         >>> data.group_by("hood").aggregate(n=len, price=lambda x: mean(x.pluck("price")))
         """
         by = self._group_keys
-        groups = self.unique(*by).deepcopy().select(*by)
-        extract = operator.itemgetter(*by)
+        extract = operator.itemgetter(*by) if by else lambda x: ()
         items_by_group = {}
         for item in self:
             id = extract(item)
             items_by_group.setdefault(id, []).append(item)
+        # Build group items directly from the unique ids,
+        # sort to get groups in order regardless of Nones.
+        groups = self.__class__(dict(zip(by, id if len(by) > 1 else (id,)))
+                                for id in items_by_group)
+
         key_function_pairs = key_function_pairs.items()
         for group in groups.sort(**dict.fromkeys(by, 1)):
             id = extract(group)
@@ -325,7 +330,7 @@ class ListOfDicts(list):
         `keys` is an optional list of keys to limit to. `types` is an optional
         dict mapping keys to datatypes. `kwargs` are passed to ``json.load``.
         """
-        data = json.loads(string, **kwargs)
+        data = util.load_json(string, **kwargs)
         if not isinstance(data, list):
             raise TypeError("Not a list")
         if keys:
@@ -333,11 +338,22 @@ class ListOfDicts(list):
             for item in data:
                 for key in set(item) - keys:
                     del item[key]
-        for key, type in types.items():
+        for key, kind in types.items():
             for item in data:
                 if key in item:
-                    item[key] = type(item[key])
-        return cls(data)
+                    item[key] = kind(item[key])
+        if kwargs:
+            return cls(data)
+        nested = {dict, list, tuple, set}
+        def new(item):
+            if not nested.isdisjoint(map(type, item.values())):
+                return AttributeDict(item)
+            # Items with only scalar values can bypass
+            # AttributeDict.__init__ checks of each value for speed.
+            flat = AttributeDict()
+            dict.update(flat, item)
+            return flat
+        return cls(map(new, data), as_is=True)
 
     def full_join(self, other, *by):
         """
@@ -354,22 +370,45 @@ class ListOfDicts(list):
         >>> reviews = di.read_json("data/listings-reviews.json")
         >>> listings.full_join(reviews, "id")
         """
-        acounter = itertools.count(start=1)
-        bcounter = itertools.count(start=1)
-        a = self.deepcopy().modify(_aid_=lambda x: next(acounter))
-        b = other.deepcopy().modify(_bid_=lambda x: next(bcounter))
-        ab = a.deepcopy().left_join(b, *by)
-        # Fill in missing _bid_ with bogus values.
-        ab = ab.fill_missing_keys(_bid_=next(bcounter))
-        # Check which items of b were not joined into a,
-        # if no items remain, full join is the same as left join ab.
-        b = b.anti_join(ab, "_bid_")
-        if len(b) == 0:
-            return ab.unselect("_aid_", "_bid_")
-        ba = b.left_join(a, *by)
-        # Fill in missing _aid_ with bogus values.
-        ba = ba.fill_missing_keys(_aid_=next(acounter))
-        return (ab + ba).sort(_aid_=1, _bid_=1).unselect("_aid_", "_bid_")
+        by1, by2 = self._split_join_by(*by)
+        a = self.deepcopy()
+        b = other.deepcopy()
+        src = a._get_join_indices(b, by1, by2)
+        # Check which items of b were not joined into a and join those
+        # in turn with a, to be placed after their match in a or if
+        # not found, at the end. For identifiers in by whose name
+        # differs in a and b, rename and keep the variant found in a.
+        found = set(src)
+        ba = [x for i, x in enumerate(b) if i not in found]
+        ba = self.__class__(ba, as_is=True)
+        ba_src = ba._get_join_indices(a, by2, by1)
+        ba_by_src = {}
+        for item, i in zip(ba, ba_src):
+            if i > -1:
+                item.update({k: v for k, v in a[i].items() if k not in by1})
+            for key1, key2 in zip(by1, by2):
+                if key1 != key2:
+                    item[key1] = item.pop(key2)
+            ba_by_src.setdefault(i, []).append(item)
+        out = []
+        for i, item in enumerate(a):
+            if src[i] > -1:
+                item.update({k: v for k, v in b[src[i]].items() if k not in by2})
+            out.append(item)
+            out.extend(ba_by_src.get(i, []))
+        out.extend(ba_by_src.get(-1, []))
+        return a._new(out)
+
+    def _get_join_indices(self, other, by1, by2):
+        # Extract join keys as columns and return for each item of self
+        # the index of the first matching item in other or -1 if none.
+        other_by_id = {}
+        other_ids = map(operator.itemgetter(*by2), other)
+        for i, id in enumerate(other_ids):
+            other_by_id.setdefault(id, i)
+        get = other_by_id.get
+        self_ids = map(operator.itemgetter(*by1), self)
+        return [get(x, -1) for x in self_ids]
 
     def group_by(self, *keys):
         """
@@ -407,16 +446,14 @@ class ListOfDicts(list):
         >>> listings.inner_join(reviews, "id")
         """
         by1, by2 = self._split_join_by(*by)
-        extract1 = operator.itemgetter(*by1)
-        extract2 = operator.itemgetter(*by2)
-        other_by_id = {extract2(x): x for x in reversed(other)}
-        for item in self:
-            id = extract1(item)
-            if id in other_by_id:
-                new = other_by_id[id]
-                new = {k: v for k, v in new.items() if k not in by2}
-                item.update(new)
-                yield item
+        src = self._get_join_indices(other, by1, by2)
+        new = {}
+        for item, i in zip(self, src):
+            if i < 0: continue
+            if i not in new:
+                new[i] = {k: v for k, v in other[i].items() if k not in by2}
+            item.update(new[i])
+            yield item
 
     @deco.new_from_generator
     def insert(self, index, item):
@@ -461,13 +498,15 @@ class ListOfDicts(list):
         >>> listings.left_join(reviews, "id")
         """
         by1, by2 = self._split_join_by(*by)
-        extract1 = operator.itemgetter(*by1)
-        extract2 = operator.itemgetter(*by2)
-        other_by_id = {extract2(x): x for x in reversed(other)}
-        for item in self:
-            new = other_by_id.get(extract1(item), {})
-            new = {k: v for k, v in new.items() if k not in by2}
-            item.update(new)
+        src = self._get_join_indices(other, by1, by2)
+        new = {}
+        for item, i in zip(self, src):
+            if i < 0:
+                yield item
+                continue
+            if i not in new:
+                new[i] = {k: v for k, v in other[i].items() if k not in by2}
+            item.update(new[i])
             yield item
 
     def map(self, function):
@@ -486,9 +525,12 @@ class ListOfDicts(list):
         return self.__class__(new) if coerce else new
 
     def _mark_obsolete(self):
-        if isinstance(self._predecessor, ListOfDicts):
-            self._predecessor._mark_obsolete()
-        self._obsolete = True
+        # Walk up the chain of predecessors, stopping at the first one
+        # already marked, as all of its predecessors are marked as well.
+        data = self
+        while isinstance(data, ListOfDicts) and not data._obsolete:
+            data._obsolete = True
+            data = data._predecessor
 
     @deco.obsoletes
     @deco.new_from_generator
@@ -611,7 +653,7 @@ class ListOfDicts(list):
         """
         Return a new list from CSV file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `keys` is an optional list of keys to limit to. `types` is an optional
         dict mapping keys to datatypes.
         """
@@ -626,7 +668,13 @@ class ListOfDicts(list):
                     for i in reversed(drop):
                         del row[i]
                 colnames = keys
-            data = cls(dict(zip(colnames, x)) for x in rows)
+            def new(row):
+                # CSV values are always strings, so we can bypass
+                # AttributeDict.__init__ checks of each value for speed.
+                item = AttributeDict()
+                dict.update(item, zip(colnames, row))
+                return item
+            data = cls(map(new, rows), as_is=True)
             for key, type in types.items():
                 for item in data:
                     if key in item:
@@ -638,7 +686,7 @@ class ListOfDicts(list):
         """
         Return a new list from JSON file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `keys` is an optional list of keys to limit to. `types` is an optional
         dict mapping keys to datatypes. `kwargs` are passed to ``json.load``.
         """
@@ -650,7 +698,7 @@ class ListOfDicts(list):
         """
         Return a new list from Pickle file `path`.
 
-        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically decompress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         with util.xopen(path, "rb") as f:
             return cls(pickle.load(f))
@@ -700,7 +748,13 @@ class ListOfDicts(list):
         >>> data.select("id", "hood", "zipcode")
         """
         for item in self:
-            yield AttributeDict({x: item[x] for x in keys if x in item})
+            # Values are already coerced, so we can bypass
+            # AttributeDict.__init__ checks of each value for speed.
+            new = AttributeDict()
+            for key in keys:
+                if key in item:
+                    dict.__setitem__(new, key, item[key])
+            yield new
 
     @deco.new_from_generator
     def semi_join(self, other, *by):
@@ -735,14 +789,16 @@ class ListOfDicts(list):
         """
         data = self
         # Sort one key at a time to handle reverse and Nones correct.
+        # Split off Nones to sort by the plain values, which avoids
+        # allocating a tuple per item. Both passes are stable.
         # https://stackoverflow.com/a/55866810
         for key, dir in list(key_dir_pairs.items())[::-1]:
             if dir not in [1, -1]:
                 raise ValueError("dir should be 1 or -1")
-            def sort_key(item):
-                return ((item[key] is None, item[key]) if dir > 0 else
-                        (item[key] is not None, item[key]))
-            data = sorted(data, key=sort_key, reverse=dir < 0)
+            nones = [x for x in data if x[key] is None]
+            data = [x for x in data if x[key] is not None]
+            data.sort(key=operator.itemgetter(key), reverse=dir < 0)
+            data.extend(nones)
         return self._new(data)
 
     def split(self, *by):
@@ -777,7 +833,20 @@ class ListOfDicts(list):
         return self._new(self[-n:])
 
     def _to_columns(self):
-        return {k: self.pluck(k) for k in self[0]} if self else {}
+        if not self: return {}
+        keys = list(self[0])
+        if len(keys) < 2:
+            return {k: self.pluck(k) for k in keys}
+        # Extract all values of an item at once and transpose,
+        # falling back on get for items with missing keys.
+        extract = operator.itemgetter(*keys)
+        def get_values(item):
+            try:
+                return extract(item)
+            except KeyError:
+                return tuple(item.get(x, None) for x in keys)
+        columns = zip(*map(get_values, self))
+        return dict(zip(keys, map(list, columns)))
 
     def to_data_frame(self):
         """
@@ -843,11 +912,21 @@ class ListOfDicts(list):
             for item in self:
                 keys &= set(item)
         found_ids = set()
+        found = found_ids.add
+        if len(keys) == 1:
+            # Index directly to avoid itemgetter call overhead.
+            [key] = keys
+            for item in self:
+                id = item[key]
+                if id not in found_ids:
+                    found(id)
+                    yield item
+            return
         extract = operator.itemgetter(*keys)
         for item in self:
             id = extract(item)
             if id not in found_ids:
-                found_ids.add(id)
+                found(id)
                 yield item
 
     @deco.obsoletes
@@ -861,15 +940,14 @@ class ListOfDicts(list):
         """
         for item in self:
             for key in keys:
-                if key in item:
-                    del item[key]
+                item.pop(key, None)
             yield item
 
     def write_csv(self, path, *, encoding="utf-8", header=True, sep=","):
         """
         Write list to CSV file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         if not self:
             raise ValueError("Cannot write empty CSV file")
@@ -877,23 +955,30 @@ class ListOfDicts(list):
         keys = list(self.keys())
         util.makedirs_for_file(path)
         with util.xopen(path, "wt", encoding=encoding) as f:
-            writer = csv.DictWriter(f,
-                                    keys,
-                                    dialect="unix",
-                                    delimiter=sep,
-                                    quoting=csv.QUOTE_MINIMAL)
-
-            writer.writeheader() if header else None
-            for item in self:
-                # Fill in missing as None.
-                item = {**dict.fromkeys(keys), **item}
-                writer.writerow(item)
+            writer = csv.writer(f,
+                                dialect="unix",
+                                delimiter=sep,
+                                quoting=csv.QUOTE_MINIMAL)
+
+            writer.writerow(keys) if header else None
+            n = len(keys)
+            missing = dict.fromkeys(keys)
+            extract = operator.itemgetter(*keys)
+            def yield_rows():
+                for item in self:
+                    # Fill in missing as None.
+                    if len(item) < n:
+                        item = {**missing, **item}
+                    row = extract(item)
+                    yield (row,) if n == 1 else row
+            # Write all rows in one call, in a single pass over items.
+            writer.writerows(yield_rows())
 
     def write_json(self, path, *, encoding="utf-8", **kwargs):
         """
         Write list to JSON file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         `kwargs` are passed to ``json.JSONEncoder``.
         """
         kwargs.setdefault("default", str)
@@ -902,17 +987,30 @@ class ListOfDicts(list):
         util.makedirs_for_file(path)
         with util.xopen(path, "wt", encoding=encoding) as f:
             encoder = json.JSONEncoder(**kwargs)
+            # Join chunks into batches to avoid a huge amount of tiny
+            # writes, which are slow especially when compressing.
+            chunks = []
             for chunk in encoder.iterencode(self):
-                f.write(chunk)
-            f.write("\n")
+                chunks.append(chunk)
+                if len(chunks) >= 1000:
+                    f.write("".join(chunks))
+                    chunks.clear()
+            chunks.append("\n")
+            f.write("".join(chunks))
 
     def write_pickle(self, path):
         """
         Write list to Pickle file `path`.
 
-        Will automatically compress if `path` ends in ``.bz2|.gz|.xz``.
+        Will automatically compress if `path` ends in ``.bz2|.gz|.xz|.zst``.
         """
         util.makedirs_for_file(path)
         with util.xopen(path, "wb") as f:
-            out = [dict(x) for x in self]
-            pickle.dump(out, f, pickle.HIGHEST_PROTOCOL)
+            # Write plain dicts so that loading won't require attd,
+            # but reduce on the fly to avoid copying all the dicts.
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            table = copyreg.dispatch_table.copy()
+            table[AttributeDict] = lambda x: (
+                dict, (), None, None, iter(x.items()))
+            pickler.dispatch_table = table
+            pickler.dump(list(self))
@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 
 import functools
+import pickle
 
 from dataiter import DataFrame
 from dataiter import GeoJSON
@@ -36,6 +37,18 @@ def cached(function):
         return cache[path].deepcopy()
     return wrapper
 
+def cached_pickle(function):
+    # Like cached, but keep plain dicts pickled and return a fresh
+    # unpickled copy, which is faster than deepcopy of a list of dicts.
+    cache = {}
+    @functools.wraps(function)
+    def wrapper(path):
+        if path not in cache:
+            out = [dict(x) for x in function(path)]
+            cache[path] = pickle.dumps(out, pickle.HIGHEST_PROTOCOL)
+        return ListOfDicts(pickle.loads(cache[path]))
+    return wrapper
+
 @cached
 def data_frame(name):
     path = get_data_path(name)
@@ -54,7 +67,7 @@ def get_data_path(name):
         if path.exists():
             return path
 
-@cached
+@cached_pickle
 def list_of_dicts(name):
     path = get_data_path(name)
     extension = path.suffix.lstrip(".")
@@ -165,6 +165,9 @@ class TestAggregate:
             pytest.skip("No Numba")
         with patch("dataiter.USE_NUMBA", use_numba):
             data = DataFrame(g=GROUPS, a=input)
+            # Make sure we're testing the typed code paths,
+            # not an object fallback that would bypass Numba.
+            assert not data.a.is_object()
             stat = data.group_by("g").aggregate(a=function("a"))
             expected = Vector(output)
             try:
@@ -187,6 +190,53 @@ class TestAggregate:
             stat = data.group_by("g").aggregate(n=count())
             assert (stat.n == 2).all()
 
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_aggregate_count_unique_drop_na(self, use_numba):
+        if use_numba and not dataiter.USE_NUMBA:
+            pytest.skip("No Numba")
+        with patch("dataiter.USE_NUMBA", use_numba):
+            data = DataFrame(g=GROUPS, a=[1, 1, 3, NaN, 5, 6, 7, NaN, NaN, NaN])
+            stat = data.group_by("g").aggregate(a=count_unique("a", drop_na=True))
+            assert stat.a.equal(Vector([1, 1, 2, 1, 0]))
+
+    def test_aggregate_dtype(self):
+        # Without Numba, results should have the same dtype
+        # as the corresponding NumPy functions would give.
+        with patch("dataiter.USE_NUMBA", False):
+            for dtype, sum_dtype, mean_dtype in [(np.float32, np.float32, np.float32),
+                                                 (np.int32, np.int64, np.float64)]:
+                data = DataFrame(g=GROUPS, a=Vector.fast(range(10), dtype))
+                stat = data.group_by("g").aggregate(
+                    max=max("a"),
+                    mean=mean("a"),
+                    min=min("a"),
+                    std=std("a"),
+                    sum=sum("a"),
+                    var=var("a"))
+                assert stat.max.dtype == dtype
+                assert stat.mean.dtype == mean_dtype
+                assert stat.min.dtype == dtype
+                assert stat.std.dtype == mean_dtype
+                assert stat.sum.dtype == sum_dtype
+                assert stat.var.dtype == mean_dtype
+
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_aggregate_mode_nat(self, use_numba):
+        if use_numba and not dataiter.USE_NUMBA:
+            pytest.skip("No Numba")
+        with patch("dataiter.USE_NUMBA", use_numba):
+            a = np.datetime64("2020-01-01")
+            b = np.datetime64("2020-01-02")
+            data = DataFrame(g=[1, 1, 1, 1, 1], a=[NaT, b, b, a, a])
+            stat = data.group_by("g").aggregate(a=mode("a", drop_na=False))
+            assert stat.a.tolist() == [b.item()]
+
+    def test_aggregate_ddof(self):
+        data = DataFrame(g=GROUPS, a=[1, 1, 2, 3, 5, 7, 8, 12, 13, NaN])
+        stat = data.group_by("g").aggregate(s=std("a", ddof=1), v=var("a", ddof=1))
+        assert np.allclose(stat.s, [0.0, np.sqrt(0.5), np.sqrt(2.0), np.sqrt(8.0), NaN], equal_nan=True)
+        assert np.allclose(stat.v, [0.0, 0.5, 2.0, 8.0, NaN], equal_nan=True)
+
     def test_all(self):
         assert all(EMPTY_VECTOR)
         assert all(Vector([T, T]))
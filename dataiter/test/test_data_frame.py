@@ -23,7 +23,6 @@
 import dataiter as di
 import numpy as np
 import pytest
-import tempfile
 
 from dataiter import DataFrame
 from dataiter import DataFrameColumn
@@ -470,37 +469,37 @@ class TestDataFrame:
         DataFrame.read_json(test.get_data_path("vehicles.json"))
 
     @pytest.mark.filterwarnings(IGNORE_NPZ_PICKLE_WARNING)
-    def test_read_npz(self):
+    def test_read_npz(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".npz")
+        path = str(tmp_path / "test.npz")
         orig.write_npz(path)
         data = DataFrame.read_npz(path)
         assert data == orig
 
     @pytest.mark.filterwarnings(IGNORE_NPZ_PICKLE_WARNING)
-    def test_read_npz_path(self):
+    def test_read_npz_path(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".npz")
+        path = str(tmp_path / "test.npz")
         orig.write_npz(path)
         DataFrame.read_npz(Path(path))
 
-    def test_read_parquet(self):
+    def test_read_parquet(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".parquet")
+        path = str(tmp_path / "test.parquet")
         orig.write_parquet(path)
         data = DataFrame.read_parquet(path)
         assert data == orig
 
-    def test_read_pickle(self):
+    def test_read_pickle(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         data = DataFrame.read_pickle(path)
         assert data == orig
 
-    def test_read_pickle_path(self):
+    def test_read_pickle_path(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         DataFrame.read_pickle(Path(path))
 
@@ -601,6 +600,12 @@ class TestDataFrame:
         rows = [x.tolist() for x in rows]
         assert rows == [[0], [1, 2], [3, 4], [5]]
 
+    def test_split_na(self):
+        data = DataFrame(x=[np.nan, 1, np.nan, 1, 2])
+        rows = data.split("x")
+        rows = [x.tolist() for x in rows]
+        assert rows == [[1, 3], [4], [0, 2]]
+
     def test_tail(self):
         data = test.data_frame("vehicles.csv")
         assert data.tail(10) == data.slice(list(range(data.nrow - 10, data.nrow)))
@@ -687,59 +692,59 @@ class TestDataFrame:
         assert np.all(data.make == "Talbot")
         assert np.all(data.test == 1)
 
-    def test_write_csv(self):
+    def test_write_csv(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".csv")
+        path = str(tmp_path / "test.csv")
         orig.write_csv(path)
         data = DataFrame.read_csv(path)
         assert data == orig
 
-    def test_write_csv_path(self):
+    def test_write_csv_path(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".csv")
+        path = str(tmp_path / "test.csv")
         orig.write_csv(Path(path))
 
-    def test_write_json(self):
+    def test_write_json(self, tmp_path):
         orig = test.data_frame("downloads.json")
-        handle, path = tempfile.mkstemp(".json")
+        path = str(tmp_path / "test.json")
         orig.write_json(path)
         data = DataFrame.read_json(path)
         assert data == orig
 
-    def test_write_json_path(self):
+    def test_write_json_path(self, tmp_path):
         orig = test.data_frame("downloads.json")
-        handle, path = tempfile.mkstemp(".json")
+        path = str(tmp_path / "test.json")
         orig.write_json(Path(path))
 
     @pytest.mark.filterwarnings(IGNORE_NPZ_PICKLE_WARNING)
-    def test_write_npz(self):
+    def test_write_npz(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".npz")
+        path = str(tmp_path / "test.npz")
         orig.write_npz(path)
         data = DataFrame.read_npz(path)
         assert data == orig
 
     @pytest.mark.filterwarnings(IGNORE_NPZ_PICKLE_WARNING)
-    def test_write_npz_path(self):
+    def test_write_npz_path(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".npz")
+        path = str(tmp_path / "test.npz")
         orig.write_npz(Path(path))
 
-    def test_write_parquet(self):
+    def test_write_parquet(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".parquet")
+        path = str(tmp_path / "test.parquet")
         orig.write_parquet(path)
         data = DataFrame.read_parquet(path)
         assert data == orig
 
-    def test_write_pickle(self):
+    def test_write_pickle(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         data = DataFrame.read_pickle(path)
         assert data == orig
 
-    def test_write_pickle_path(self):
+    def test_write_pickle_path(self, tmp_path):
         orig = test.data_frame("vehicles.csv")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(Path(path))
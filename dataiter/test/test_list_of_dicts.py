@@ -21,7 +21,8 @@
 # THE SOFTWARE.
 
 import datetime
-import tempfile
+import pickle
+import re
 
 from attd import AttributeDict
 from dataiter import ListOfDicts
@@ -117,6 +118,18 @@ class TestListOfDicts:
             "downloads": 58299,
         }]
 
+    def test_aggregate_multiple_keys(self):
+        data = test.list_of_dicts("downloads.json")
+        stat = data.group_by("category", "date").aggregate(n=len)
+        assert len(stat) == len(data.unique("category", "date"))
+        assert all(list(x.keys()) == ["category", "date", "n"] for x in stat)
+        assert stat.pluck("n") == [1] * len(stat)
+
+    def test_aggregate_ungrouped(self):
+        data = test.list_of_dicts("downloads.json")
+        stat = data.aggregate(n=len)
+        assert stat == [{"n": len(data)}]
+
     def test_anti_join(self):
         orig = test.list_of_dicts("downloads.json")
         holidays = test.list_of_dicts("holidays.json")
@@ -236,6 +249,13 @@ class TestListOfDicts:
         data = ListOfDicts.from_json(text)
         assert data == orig
 
+    def test_from_json_nested(self):
+        data = ListOfDicts.from_json('[{"a": {"b": [{"c": 1}]}}, {"a": 1}]')
+        assert isinstance(data[0].a, AttributeDict)
+        assert isinstance(data[0].a.b[0], AttributeDict)
+        assert data[0].a.b[0].c == 1
+        assert data[1].a == 1
+
     def test_full_join(self):
         orig = test.list_of_dicts("downloads.json")
         holidays = test.list_of_dicts("holidays.json")
@@ -246,6 +266,16 @@ class TestListOfDicts:
         assert sum("downloads" not in x for x in data) == 25
         assert sum(data.pluck("downloads", 0)) == 541335745
 
+    def test_full_join_by_tuple(self):
+        orig = test.list_of_dicts("downloads.json")
+        holidays = test.list_of_dicts("holidays.json")
+        holidays = holidays.rename(holiday_date="date")
+        data = orig.full_join(holidays, ("date", "holiday_date"))
+        assert len(data) == 930
+        assert sum("holiday" in x for x in data) == 60
+        assert sum("holiday_date" in x for x in data) == 0
+        assert sum(data.pluck("downloads", 0)) == 541335745
+
     def test_head(self):
         data = test.list_of_dicts("downloads.json")
         assert data.head(10) == data[:10]
@@ -288,6 +318,12 @@ class TestListOfDicts:
         assert sum("holiday_date" in x for x in data) == 0
         assert sum(data.pluck("downloads")) == 541335745
 
+    def test_left_join_multiple_matches(self):
+        a = ListOfDicts([dict(x=1), dict(x=2), dict(x=1)])
+        b = ListOfDicts([dict(x=1, y="a"), dict(x=1, y="b")])
+        data = a.left_join(b, "x")
+        assert data == [dict(x=1, y="a"), dict(x=2), dict(x=1, y="a")]
+
     def test_map(self):
         orig = test.list_of_dicts("downloads.json")
         data = orig.map(lambda x: {**x, "year": int(x.date[:4])})
@@ -301,6 +337,14 @@ class TestListOfDicts:
         data = data.modify(b=lambda x: 2)
         data = data.modify(c=lambda x: 3)
 
+    def test__mark_obsolete_long_chain(self):
+        orig = data = ListOfDicts([dict(a=1)])
+        for i in range(5000):
+            data = data.modify(a=lambda x: x.a + 1)
+        assert data[0].a == 5001
+        assert orig._obsolete
+        assert not data._obsolete
+
     def test_modify(self):
         orig = test.list_of_dicts("downloads.json")
         data = orig.modify(year=lambda x: int(x.date[:4]))
@@ -393,16 +437,16 @@ class TestListOfDicts:
         assert isinstance(data[100].date, datetime.date)
         assert isinstance(data[100].downloads, int)
 
-    def test_read_pickle(self):
+    def test_read_pickle(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         data = ListOfDicts.read_pickle(path)
         assert data == orig
 
-    def test_read_pickle_path(self):
+    def test_read_pickle_path(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         ListOfDicts.read_pickle(Path(path))
 
@@ -526,6 +570,13 @@ class TestListOfDicts:
         assert data.nrow == len(orig)
         assert data.ncol == len(orig[0])
 
+    def test_to_data_frame_missing_keys(self):
+        orig = ListOfDicts([dict(a=1, b=2), dict(a=3)])
+        data = orig.to_data_frame()
+        assert data.a.tolist() == [1, 3]
+        assert data.b.tolist()[0] == 2
+        assert data.b.is_na().tolist() == [False, True]
+
     def test_to_json(self):
         orig = test.list_of_dicts("downloads.json")
         text = orig.to_json()
@@ -565,38 +616,67 @@ class TestListOfDicts:
         assert all("downloads" not in x for x in data)
         assert orig._obsolete
 
-    def test_write_csv(self):
+    def test_write_csv(self, tmp_path):
         orig = test.list_of_dicts("vehicles.csv")
-        handle, path = tempfile.mkstemp(".csv")
+        path = str(tmp_path / "test.csv")
         orig.write_csv(path)
         data = ListOfDicts.read_csv(path)
         assert data == orig
 
-    def test_write_csv_path(self):
+    def test_write_csv_missing_keys(self, tmp_path):
+        orig = ListOfDicts([dict(a="1", b="2"), dict(b="3"), dict(a="4")])
+        path = str(tmp_path / "test.csv")
+        orig.write_csv(path)
+        assert Path(path).read_text() == "a,b\n1,2\n,3\n4,\n"
+
+    def test_write_csv_one_key(self, tmp_path):
+        orig = ListOfDicts([dict(a="xyz"), dict(a="x,y")])
+        path = str(tmp_path / "test.csv")
+        orig.write_csv(path)
+        assert Path(path).read_text() == 'a\nxyz\n"x,y"\n'
+
+    def test_write_csv_path(self, tmp_path):
         orig = test.list_of_dicts("vehicles.csv")
-        handle, path = tempfile.mkstemp(".csv")
+        path = str(tmp_path / "test.csv")
         orig.write_csv(Path(path))
 
-    def test_write_json(self):
+    def test_write_json(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".json")
+        path = str(tmp_path / "test.json")
         orig.write_json(path)
         data = ListOfDicts.read_json(path)
         assert data == orig
 
-    def test_write_json_path(self):
+    def test_write_json_path(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".json")
+        path = str(tmp_path / "test.json")
         orig.write_json(Path(path))
 
-    def test_write_pickle(self):
+    def test_write_pickle(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(path)
         data = ListOfDicts.read_pickle(path)
         assert data == orig
 
-    def test_write_pickle_path(self):
+    def test_write_pickle_copyreg(self, tmp_path):
+        # Values pickled via copyreg should still work.
+        orig = ListOfDicts([{"x": re.compile("a+")}])
+        path = str(tmp_path / "test.pkl")
+        orig.write_pickle(path)
+        data = ListOfDicts.read_pickle(path)
+        assert data[0].x.pattern == "a+"
+
+    def test_write_pickle_plain_dicts(self, tmp_path):
+        orig = test.list_of_dicts("downloads.json")
+        path = str(tmp_path / "test.pkl")
+        orig.write_pickle(path)
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        assert data == orig
+        assert all(type(x) is dict for x in data)
+
+    def test_write_pickle_path(self, tmp_path):
         orig = test.list_of_dicts("downloads.json")
-        handle, path = tempfile.mkstemp(".pkl")
+        path = str(tmp_path / "test.pkl")
         orig.write_pickle(Path(path))
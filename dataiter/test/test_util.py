@@ -23,7 +23,6 @@
 import datetime
 import math
 import numpy as np
-import tempfile
 
 from dataiter import util
 
@@ -112,6 +111,14 @@ class TestUtil:
         assert util.length([1]) == 1
         assert util.length([1, 2]) == 2
 
+    def test_load_json(self):
+        assert util.load_json('[{"a": 1, "b": "c"}]') == [{"a": 1, "b": "c"}]
+
+    def test_load_json_fallback(self):
+        assert np.isnan(util.load_json("[NaN]")[0])
+        assert util.load_json(f"[{2**70}]") == [2**70]
+        assert util.load_json("[1.5]", parse_float=str) == ["1.5"]
+
     def test_quote(self):
         assert util.quote("hello") == '"hello"'
         assert util.quote('"hello"') == '"\\"hello\\""'
@@ -145,33 +152,49 @@ class TestUtil:
         assert util.utruncate("abc\u200bdef", 4) == "abc\u200bd"
         assert util.utruncate("abc\u200bdef\u200b", 4) == "abc\u200bd"
 
-    def test_xopen_bz2(self):
+    def test_xopen_bz2(self, tmp_path):
         text = "test åäö"
-        handle, path = tempfile.mkstemp(".bz2")
+        path = str(tmp_path / "test.bz2")
         with util.xopen(path, "wt") as f:
             f.write(text)
         with util.xopen(path, "rt") as f:
             assert f.read() == text
 
-    def test_xopen_gz(self):
+    def test_xopen_gz(self, tmp_path):
         text = "test åäö"
-        handle, path = tempfile.mkstemp(".gz")
+        path = str(tmp_path / "test.gz")
         with util.xopen(path, "wt") as f:
             f.write(text)
         with util.xopen(path, "rt") as f:
             assert f.read() == text
 
-    def test_xopen_txt(self):
+    def test_xopen_zst(self, tmp_path):
+        text = "test åäö"
+        path = str(tmp_path / "test.zst")
+        with util.xopen(path, "wt") as f:
+            f.write(text)
+        with util.xopen(path, "rt") as f:
+            assert f.read() == text
+
+    def test_xopen_zst_compresslevel(self, tmp_path):
+        text = "test åäö"
+        path = str(tmp_path / "test.zst")
+        with util.xopen(path, "wt", compresslevel=1) as f:
+            f.write(text)
+        with util.xopen(path, "rt") as f:
+            assert f.read() == text
+
+    def test_xopen_txt(self, tmp_path):
         text = "test åäö"
-        handle, path = tempfile.mkstemp(".txt")
+        path = str(tmp_path / "test.txt")
         with util.xopen(path, "wt") as f:
             f.write(text)
         with util.xopen(path, "rt") as f:
             assert f.read() == text
 
-    def test_xopen_xz(self):
+    def test_xopen_xz(self, tmp_path):
         text = "test åäö"
-        handle, path = tempfile.mkstemp(".xz")
+        path = str(tmp_path / "test.xz")
         with util.xopen(path, "wt") as f:
             f.write(text)
         with util.xopen(path, "rt") as f:
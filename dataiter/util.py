@@ -25,6 +25,7 @@ import dataiter
 import datetime
 import gzip
 import itertools
+import json
 import lzma
 import math
 import numpy as np
@@ -87,6 +88,18 @@ def is_scalar(value):
 def length(value):
     return 1 if is_scalar(value) else len(value)
 
+def load_json(string, **kwargs):
+    # Use orjson if available for speed, falling back on the standard
+    # library json for any kwargs and input that orjson doesn't support,
+    # such as NaN and integers that don't fit in 64 bits.
+    if not kwargs:
+        try:
+            import orjson
+            return orjson.loads(string)
+        except (ImportError, ValueError):
+            pass
+    return json.loads(string, **kwargs)
+
 def makedirs_for_file(path):
     return Path(path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -127,9 +140,10 @@ def ulen(string):
     return length if length >= 0 else 0
 
 def unique_types(seq):
+    # x != x is a lot faster than np.isnan for Python floats.
     return set(x.__class__ for x in seq if
                x is not None and
-               not (isinstance(x, float) and np.isnan(x)))
+               not (isinstance(x, float) and x != x))
 
 @deco.listify
 def upad(strings, *, align="right"):
@@ -161,6 +175,12 @@ def xopen(path, mode="r", **kwargs):
         return gzip.open(path, mode, **kwargs)
     if str(path).endswith(".xz"):
         return lzma.open(path, mode)
+    if str(path).endswith(".zst"):
+        import zstandard
+        if "compresslevel" in kwargs:
+            level = kwargs.pop("compresslevel")
+            kwargs["cctx"] = zstandard.ZstdCompressor(level=level)
+        return zstandard.open(path, mode, **kwargs)
     return open(path, mode, **kwargs)
 
 def yield_colnames():
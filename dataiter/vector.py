@@ -313,6 +313,9 @@ class Vector(np.ndarray):
             return np.isnan(self)
         if self.is_string() or self._is_string_fixed():
             return self == dtypes.string.na_object
+        if not self.is_object():
+            # Boolean, integer, bytes etc. can't hold missing values.
+            return self.fast(np.zeros(self.length, bool))
         # Can't use np.isin here since elements can be arrays.
         return self.fast([x is None for x in self], bool)
 
@@ -462,6 +465,14 @@ class Vector(np.ndarray):
             # to the old-style fixed-width strings! This is probably
             # temporary and can be removed once StringDType has matured.
             return self.astype(f"U{n}")
+        if (self.is_integer() and
+            self.dtype.itemsize > 2 and
+            self.length > 0 and
+            int(self.max()) - int(self.min()) < 2**15):
+            # NumPy uses radix sort for a stable sort of 16-bit integers,
+            # which is much faster than the timsort used otherwise.
+            # Shifting by the minimum preserves order and ties.
+            return (self - self.min()).astype(np.int16)
         return self
 
     def range(self):
@@ -501,7 +512,9 @@ class Vector(np.ndarray):
         if na.all():
             # Avoid trying to evaluate min/max/mean of all NA.
             self = self.fast(np.repeat(1, self.length))
-        self = self._optimize_for_argsort()
+        if method == "ordinal" or not self.is_integer():
+            # np.unique below is faster for wide integers as is.
+            self = self._optimize_for_argsort()
         out = np.zeros_like(self, int)
         if method == "min":
             # https://stackoverflow.com/a/14672797/16369038
@@ -591,7 +604,7 @@ class Vector(np.ndarray):
             na = cls._std_to_np_na_value(types)
         seq = [na if
                x is None or
-               (isinstance(x, float) and np.isnan(x))
+               (isinstance(x, float) and x != x)
                else x for x in seq]
         if dtype is not None:
             if np.issubdtype(dtype, np.integer) and np.nan in seq:
@@ -600,6 +613,14 @@ class Vector(np.ndarray):
             return cls._np_array(seq, dtype)
         # NaT values bring in np.datetime64 to types.
         types.discard(np.datetime64)
+        if types == {datetime.date}:
+            # NumPy's conversion of date objects is slow,
+            # it's a lot faster to go via proleptic ordinals.
+            epoch = datetime.date(1970, 1, 1).toordinal()
+            seq = [x.astype("datetime64[D]").astype(np.int64)
+                   if isinstance(x, np.datetime64)
+                   else x.toordinal() - epoch for x in seq]
+            return np.array(seq, np.int64).view("datetime64[D]")
         for fm, to in TYPE_CONVERSIONS.items():
             if types and all(x == fm for x in types):
                 return cls._np_array(seq, to)